@@ -17,8 +17,7 @@ def main():
     storage = LocalFileStorage("./my_storage")
     
     # Save 5 instances of SomeClass as JSON
-    for i in range(5):
-        storage.save(str(i), SomeClass(chr(65 + i), i), "json")
+    storage.save_many((str(i), SomeClass(chr(65 + i), i), "json") for i in range(5))
     
     # Print metadata
     print(f"Count: {storage.count()}")  # Output: 5
@@ -2,6 +2,7 @@
 
 from .base import Storage
 from .local_file_storage import LocalFileStorage
+from .async_local_file_storage import AsyncLocalFileStorage
 from .serializers import (
     Serializer,
     SerializerRegistry,
@@ -13,6 +14,7 @@ __all__ = [
     # Storage interfaces and implementations
     "Storage",
     "LocalFileStorage",
+    "AsyncLocalFileStorage",
     # Serializers
     "Serializer",
     "SerializerRegistry",
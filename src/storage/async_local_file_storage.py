@@ -0,0 +1,150 @@
+"""Asynchronous local file system storage implementation."""
+
+import asyncio
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .local_file_storage import LocalFileStorage
+
+
+class AsyncLocalFileStorage:
+    """
+    Asyncio front end to LocalFileStorage.
+    
+    Every operation runs in a worker thread via asyncio.to_thread, so the
+    event loop is never blocked on serialization or file I/O. save_many runs
+    the items concurrently, overlapping the serialization of one object with
+    the writing of others.
+    
+    Example:
+        storage = AsyncLocalFileStorage("./my_storage")
+        await storage.save_many([("a", {"x": 1}, "json"), ("b", [1, 2], "json")])
+        
+        print(await storage.count())  # 2
+        data = await storage.get("a", "json")
+    """
+
+    __slots__ = ("_storage", "_max_concurrency")
+
+    def __init__(
+        self,
+        base_path: str | Path = "./storage",
+        cache_size: int = 128,
+        max_concurrency: int = 32,
+    ) -> None:
+        """
+        Initialize the asynchronous local file storage.
+        
+        Args:
+            base_path: The directory path where objects will be stored.
+                      Will be created if it doesn't exist.
+            cache_size: Maximum number of deserialized objects kept by get().
+                        0 disables the cache.
+            max_concurrency: Maximum number of items save_many processes at once.
+        """
+        self._storage = LocalFileStorage(base_path, cache_size=cache_size)
+        self._max_concurrency = max_concurrency
+
+    @property
+    def base_path(self) -> Path:
+        """Get the base storage directory path."""
+        return self._storage.base_path
+
+    async def save(self, key: str, value: Any, format: str) -> None:
+        """
+        Save an object to the local file system.
+        
+        Args:
+            key: Unique string identifier for the object.
+            value: The object to save.
+            format: The format name (e.g., "json", "npy").
+        
+        Raises:
+            KeyError: If the format is not supported.
+        """
+        await asyncio.to_thread(self._storage.save, key, value, format)
+
+    async def save_many(self, items: Iterable[tuple[str, Any, str]]) -> None:
+        """
+        Save several objects concurrently.
+        
+        Formats are validated before anything is written, so an unsupported
+        format leaves the storage untouched. At most max_concurrency items are
+        serialized and written at the same time.
+        
+        Args:
+            items: (key, value, format) tuples to save. If the same key and
+                   format appear more than once, the last value wins.
+        
+        Raises:
+            KeyError: If any format is not supported.
+        """
+        batch: dict[tuple[str, str], Any] = {}
+        for key, value, format in items:
+            if format not in LocalFileStorage.FORMAT_TO_EXTENSION:
+                raise KeyError(f"Unknown format: {format}")
+            batch[(key, format)] = value
+        
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        
+        async def save_one(key: str, format: str, value: Any) -> None:
+            async with semaphore:
+                await self.save(key, value, format)
+        
+        await asyncio.gather(*(save_one(key, format, value) for (key, format), value in batch.items()))
+
+    async def get(self, key: str, format: str, raw: bool = False, mmap: bool = True) -> Any:
+        """
+        Retrieve an object from storage.
+        
+        Args:
+            key: The unique identifier of the object.
+            format: The format name (e.g., "json", "npy").
+            raw: If True, return the stored bytes as a read-only memoryview
+                 without deserializing them.
+            mmap: If False, return a writable in-memory copy instead of a
+                  read-only memory-mapped array for "npy".
+        
+        Returns:
+            The deserialized object.
+        
+        Raises:
+            KeyError: If the key does not exist or format not supported.
+        """
+        return await asyncio.to_thread(self._storage.get, key, format, raw, mmap)
+
+    async def exists(self, key: str, format: str) -> bool:
+        """
+        Check if a key exists in storage.
+        
+        Args:
+            key: The key to check.
+            format: The format name (e.g., "json", "npy").
+        
+        Returns:
+            True if the key exists, False otherwise.
+        """
+        return await asyncio.to_thread(self._storage.exists, key, format)
+
+    async def count(self) -> int:
+        """
+        Get the number of stored objects.
+        
+        Returns:
+            The count of objects in storage.
+        """
+        return await asyncio.to_thread(self._storage.count)
+
+    async def delete(self, key: str, format: str) -> bool:
+        """
+        Delete an object from storage.
+        
+        Args:
+            key: The key of the object to delete.
+            format: The format name (e.g., "json", "npy").
+        
+        Returns:
+            True if deleted, False if key didn't exist.
+        """
+        return await asyncio.to_thread(self._storage.delete, key, format)
@@ -1,6 +1,7 @@
 """Abstract base class for storage implementations."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -12,6 +13,8 @@ class Storage(ABC):
     from this class and implement all abstract methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def save(self, key: str, value: Any, format: str) -> None:
         """
@@ -27,6 +30,22 @@ class Storage(ABC):
         """
         pass
 
+    def save_many(self, items: Iterable[tuple[str, Any, str]]) -> None:
+        """
+        Save several objects to storage.
+        
+        The default implementation calls save() for each item. Implementations
+        that can batch writes should override it.
+        
+        Args:
+            items: (key, value, format) tuples to save.
+        
+        Raises:
+            KeyError: If any format is not supported.
+        """
+        for key, value, format in items:
+            self.save(key, value, format)
+
     @abstractmethod
     def get(self, key: str, format: str) -> Any:
         """
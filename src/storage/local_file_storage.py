@@ -1,14 +1,34 @@
 """Local file system storage implementation."""
 
+import mmap
+import os
+import struct
+import sys
+import tarfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from functools import partial
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+import numpy as np
 
 from .base import Storage
+from .serializers.base import Serializer, write_buffers
 from .serializers.registry import SerializerRegistry
 from .serializers.numpy_serializer import NumpySerializer
 from .serializers.json_serializer import JsonSerializer
 
 
+# Values stored as-is instead of being passed to a serializer
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
 class LocalFileStorage(Storage):
     """
     Storage implementation using the local file system.
@@ -25,21 +45,67 @@ class LocalFileStorage(Storage):
         print(storage.exists("my_array", "npy"))  # True
         
         arr = storage.get("my_array", "npy")  # Returns numpy array
+    
+    Recently retrieved objects are kept in an in-process LRU cache and are
+    returned again, without re-reading the file, for as long as the file's
+    modification time and size are unchanged.
     """
 
+    __slots__ = (
+        "_base_path",
+        "_registry",
+        "_serializers",
+        "_ext",
+        "_path_cache",
+        "_cache",
+        "_cache_size",
+        "_cache_lock",
+        "_count",
+        "_dir_mtime",
+        "_count_lock",
+    )
+
     # Mapping from format name to file extension
     FORMAT_TO_EXTENSION: dict[str, str] = {
         "json": ".json",
         "npy": ".npy",
     }
 
-    def __init__(self, base_path: str | Path = "./storage") -> None:
+    # File extension of the pack files written by save_pack
+    PACK_EXTENSION: str = ".pack"
+
+    # Pack file footer: offset of the index (8 bytes, big-endian)
+    PACK_FOOTER = struct.Struct(">Q")
+
+    # File extension of the archives written by save_tar
+    TAR_EXTENSION: str = ".tar"
+
+    # Number of values serialized at once by save_many
+    SAVE_WINDOW: int = 1024
+
+    # Minimum number of objects for which save_many writes from a thread
+    # pool; below it, or on a single core, starting the threads costs more
+    # than overlapping the writes saves
+    PARALLEL_WRITE_THRESHOLD: int = 64
+
+    # Upper bound on serialized bytes waiting to be written by save_many
+    MAX_INFLIGHT_BYTES: int = 256 * 1024 * 1024
+
+    # Maximum number of (key, format) -> path entries kept by _build_path
+    PATH_CACHE_SIZE: int = 4096
+
+    # Larger NumPy arrays are not kept in the get() cache
+    CACHE_MAX_ARRAY_BYTES: int = 16 * 1024 * 1024
+
+    def __init__(self, base_path: str | Path = "./storage", cache_size: int = 128) -> None:
         """
         Initialize the local file storage.
         
         Args:
             base_path: The directory path where objects will be stored.
                       Will be created if it doesn't exist.
+            cache_size: Maximum number of deserialized objects kept by get().
+                        0 disables the cache.
         """
         self._base_path = Path(base_path)
         self._base_path.mkdir(parents=True, exist_ok=True)
@@ -48,47 +114,114 @@ class LocalFileStorage(Storage):
         self._registry = SerializerRegistry()
         self._registry.register(NumpySerializer())
         self._registry.register(JsonSerializer())
+        
+        # Built-in formats are resolved directly from these dicts in the hot
+        # paths instead of going through the registry on every call
+        self._serializers: dict[str, Serializer] = {
+            sys.intern(format): self._registry.get(format)
+            for format in self.FORMAT_TO_EXTENSION
+        }
+        self._ext: dict[str, str] = {
+            sys.intern(format): extension
+            for format, extension in self.FORMAT_TO_EXTENSION.items()
+        }
+        
+        # (key, format) -> file path
+        self._path_cache: dict[tuple[str, str], Path] = {}
+        
+        # path -> ((st_dev, st_ino, st_mtime_ns, st_size), deserialized object),
+        # oldest first. Every save replaces the file, giving it a new inode
+        self._cache: OrderedDict[Path, tuple[tuple[int, int, int, int], Any]] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        
+        # Last count() result, valid while the directory mtime is unchanged
+        self._count: int | None = None
+        self._dir_mtime: int | None = None
+        self._count_lock = threading.Lock()
 
     @property
     def base_path(self) -> Path:
         """Get the base storage directory path."""
         return self._base_path
 
-    def _get_extension(self, format: str) -> str:
+    def _build_path(self, key: str, format: str) -> Path:
         """
-        Get the file extension for a format.
+        Build the file path for a key and format.
+        
+        Paths are memoized per (key, format), so repeated operations on the
+        same key skip the string formatting and Path construction.
         
         Args:
+            key: The storage key.
             format: The format name.
         
         Returns:
-            The file extension (including the dot).
+            The full file path.
         
         Raises:
             KeyError: If format is not supported.
         """
-        if format not in self.FORMAT_TO_EXTENSION:
+        path = self._path_cache.get((key, format))
+        if path is not None:
+            return path
+        
+        extension = self._ext.get(format)
+        if extension is None:
             raise KeyError(f"Unknown format: {format}")
-        return self.FORMAT_TO_EXTENSION[format]
+        path = self._base_path / f"{key}{extension}"
+        
+        if len(self._path_cache) >= self.PATH_CACHE_SIZE:
+            # Start over rather than track recency; clear() is also safe
+            # against concurrent callers
+            self._path_cache.clear()
+        self._path_cache[(sys.intern(key), format)] = path
+        return path
 
-    def _build_path(self, key: str, format: str) -> Path:
+    def _invalidate(self, file_path: Path) -> None:
         """
-        Build the file path for a key and format.
+        Drop any cached object for a file.
         
         Args:
-            key: The storage key.
-            format: The format name.
+            file_path: The file that is being written or removed.
+        """
+        with self._cache_lock:
+            self._cache.pop(file_path, None)
+
+    def _write_atomic(self, file_path: Path, write: Callable[[int], None]) -> None:
+        """
+        Write a file atomically.
         
-        Returns:
-            The full file path.
+        The data is written to a hidden temporary file next to the target,
+        which then replaces the target in one rename, so readers never see a
+        partially written object.
+        
+        Args:
+            file_path: The file to create or replace.
+            write: Called with the temporary file's descriptor to write the data.
         """
-        extension = self._get_extension(format)
-        return self._base_path / f"{key}{extension}"
+        temp_path = file_path.with_name(
+            f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(temp_path, flags, 0o666)
+            try:
+                write(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
     def save(self, key: str, value: Any, format: str) -> None:
         """
         Save an object to the local file system.
         
+        Values that are already bytes-like (bytes, bytearray, memoryview) are
+        written as-is, without going through the format's serializer.
+        
         Args:
             key: Unique string identifier for the object.
             value: The object to save.
@@ -97,33 +230,213 @@ class LocalFileStorage(Storage):
         Raises:
             KeyError: If the format is not supported.
         """
-        serializer = self._registry.get(format)
+        serializer = self._serializers.get(format)
+        if serializer is None:
+            raise KeyError(f"Unknown format: {format}")
         file_path = self._build_path(key, format)
-        data = serializer.serialize(value)
-        file_path.write_bytes(data)
+        
+        if isinstance(value, _BYTES_LIKE):
+            write = partial(write_buffers, buffers=[value])
+        else:
+            write = partial(serializer.serialize_to_fd, value=value)
+        
+        self._invalidate(file_path)
+        self._write_atomic(file_path, write)
+
+    def save_many(self, items: Iterable[tuple[str, Any, str]]) -> None:
+        """
+        Save several objects to the local file system in one batch.
+        
+        Formats are validated before anything is written, so an unsupported
+        format leaves the storage untouched. Bytes-like values are written
+        as-is, as with save(). Other values are serialized per format
+        with the serializer's batch API, sharing one process pool between all
+        batches when a serializer asks for one. On multi-core machines batches
+        of at least PARALLEL_WRITE_THRESHOLD objects are written from a thread
+        pool, overlapping the per-file open/write/close latency instead of
+        paying it once per object, with at most MAX_INFLIGHT_BYTES of
+        serialized data waiting to be written at any time. Otherwise the
+        files are written one after another as they are serialized.
+        
+        Args:
+            items: (key, value, format) tuples to save. If the same key and
+                   format appear more than once, the last value wins.
+        
+        Raises:
+            KeyError: If any format is not supported.
+        """
+        batches: dict[str, dict[Path, Any]] = {}
+        for key, value, format in items:
+            batches.setdefault(format, {})[self._build_path(key, format)] = value
+        
+        cpu_count = os.cpu_count() or 1
+        total = sum(len(batch) for batch in batches.values())
+        
+        with ExitStack() as stack:
+            process_pool = None
+            if any(self._serializers[format].prefers_processes(len(batch)) for format, batch in batches.items()):
+                process_pool = stack.enter_context(ProcessPoolExecutor(max_workers=cpu_count))
+                # Fork the workers now, before any writer thread is running
+                process_pool.submit(int).result()
+            executor = None
+            if cpu_count > 1 and total >= self.PARALLEL_WRITE_THRESHOLD:
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=cpu_count))
+            
+            pending: dict[Future[None], int] = {}
+            in_flight = 0
+            for format, batch in batches.items():
+                serializer = self._serializers[format]
+                paths = list(batch)
+                values = list(batch.values())
+                for start in range(0, len(paths), self.SAVE_WINDOW):
+                    window = slice(start, start + self.SAVE_WINDOW)
+                    payloads = self._serialize_batch(serializer, values[window], process_pool)
+                    for file_path, data in zip(paths[window], payloads):
+                        self._invalidate(file_path)
+                        write = partial(write_buffers, buffers=[data])
+                        if executor is None:
+                            self._write_atomic(file_path, write)
+                            continue
+                        
+                        # Apply backpressure until enough writes have completed
+                        size = memoryview(data).nbytes
+                        while pending and in_flight + size > self.MAX_INFLIGHT_BYTES:
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                in_flight -= pending.pop(future)
+                                future.result()
+                        pending[executor.submit(self._write_atomic, file_path, write)] = size
+                        in_flight += size
+            
+            # Propagate any write errors
+            for future in pending:
+                future.result()
 
-    def get(self, key: str, format: str) -> Any:
+    @staticmethod
+    def _serialize_batch(serializer: Serializer, values: list[Any], executor: Executor | None) -> list[Any]:
+        """
+        Serialize a batch of values, passing bytes-like values through as-is.
+        
+        Args:
+            serializer: The serializer for the batch's format.
+            values: The values to serialize.
+            executor: Process pool handed to serializer.serialize_batch.
+        
+        Returns:
+            The serialized data for each value, in the same order as values.
+        """
+        payloads = list(values)
+        pending = [i for i, value in enumerate(payloads) if not isinstance(value, _BYTES_LIKE)]
+        if pending:
+            serialized = serializer.serialize_batch([payloads[i] for i in pending], executor)
+            for i, data in zip(pending, serialized):
+                payloads[i] = data
+        return payloads
+
+    def get(self, key: str, format: str, raw: bool = False, mmap: bool = True) -> Any:
         """
         Retrieve an object from storage.
         
         Args:
             key: The unique identifier of the object.
             format: The format name (e.g., "json", "npy").
+            raw: If True, return the stored bytes as a read-only memoryview
+                 over a memory map of the file, without deserializing them.
+            mmap: If False, read the file into memory instead of returning a
+                  read-only memory-mapped array for "npy". The result is a
+                  private copy that bypasses the cache and may be modified.
         
         Returns:
-            The deserialized object.
+            The deserialized object. Cached objects are shared between calls,
+            so callers should not modify them in place.
         
         Raises:
             KeyError: If the key does not exist or format not supported.
         """
-        serializer = self._registry.get(format)
+        serializer = self._serializers.get(format)
+        if serializer is None:
+            raise KeyError(f"Unknown format: {format}")
         file_path = self._build_path(key, format)
         
-        if not file_path.exists():
-            raise KeyError(f"Key not found: {key}")
+        try:
+            if raw:
+                return self._map_file(file_path)
+            if not mmap:
+                return serializer.deserialize_from_path(file_path, mmap=False)
+            return self._load_cached(file_path, serializer.deserialize_from_path)
+        except FileNotFoundError:
+            raise KeyError(f"Key not found: {key}") from None
+
+    @staticmethod
+    def _map_file(file_path: Path) -> memoryview:
+        """
+        Memory-map a file for reading.
         
-        data = file_path.read_bytes()
-        return serializer.deserialize(data)
+        Args:
+            file_path: The file to map.
+        
+        Returns:
+            A read-only view of the file's contents.
+        
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        with open(file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # Empty files cannot be mapped
+                return memoryview(b"")
+            return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _load_cached(
+        self, file_path: Path, load: Callable[[Path], Any], stat: os.stat_result | None = None
+    ) -> Any:
+        """
+        Load a file through the LRU cache.
+        
+        Args:
+            file_path: The file to load.
+            load: Deserializes the file when it is not cached or has changed.
+            stat: The status of the file as already opened by the caller, so
+                  the cached object matches that version. Taken from
+                  file_path if not given.
+        
+        Returns:
+            The cached or freshly loaded object.
+        
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        if stat is None:
+            stat = file_path.stat()
+        version = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        
+        with self._cache_lock:
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(file_path)
+                return cached[1]
+        
+        value = load(file_path)
+        
+        if self._cache_size > 0 and self._is_cacheable(value):
+            with self._cache_lock:
+                self._cache[file_path] = (version, value)
+                self._cache.move_to_end(file_path)
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return value
+
+    def _is_cacheable(self, value: Any) -> bool:
+        """
+        Check whether a deserialized object may be kept in the get() cache.
+        
+        Args:
+            value: The deserialized object.
+        
+        Returns:
+            False for NumPy arrays larger than CACHE_MAX_ARRAY_BYTES.
+        """
+        return not (isinstance(value, np.ndarray) and value.nbytes > self.CACHE_MAX_ARRAY_BYTES)
 
     def exists(self, key: str, format: str) -> bool:
         """
@@ -143,11 +456,39 @@ class LocalFileStorage(Storage):
         """
         Get the number of stored objects.
         
+        The directory is only rescanned when its modification time has
+        changed since the last scan. Every save or delete, by this or any
+        other writer, changes it. Writes are not applied to the cached count
+        incrementally: the mtime only records the latest change, so a writer
+        cannot tell whether another one changed the directory in between.
+        
         Returns:
             The count of objects in storage.
         """
-        supported = set(self.FORMAT_TO_EXTENSION.values())
-        return sum(1 for f in self._base_path.iterdir() if f.is_file() and f.suffix in supported)
+        dir_mtime = self._base_path.stat().st_mtime_ns
+        with self._count_lock:
+            if self._count is not None and dir_mtime == self._dir_mtime:
+                return self._count
+        
+        count = self._scan_count()
+        # Only cache a scan the directory did not change during
+        if self._base_path.stat().st_mtime_ns == dir_mtime:
+            with self._count_lock:
+                self._count, self._dir_mtime = count, dir_mtime
+        return count
+
+    def _scan_count(self) -> int:
+        """
+        Count the stored objects by listing the base directory.
+        
+        Returns:
+            The number of files with a supported extension.
+        """
+        # DirEntry.is_file() uses the file type reported by the directory
+        # listing, so regular files cost no extra stat call
+        extensions = tuple(self._ext.values())
+        with os.scandir(self._base_path) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(extensions) and entry.is_file())
 
     def delete(self, key: str, format: str) -> bool:
         """
@@ -164,5 +505,226 @@ class LocalFileStorage(Storage):
         if not file_path.exists():
             return False
         
+        self._invalidate(file_path)
         file_path.unlink()
+        self._path_cache.pop((key, format), None)
         return True
+
+    def save_pack(self, name: str, items: Iterable[tuple[str, Any]], format: str) -> None:
+        """
+        Save several objects of one format into a single pack file.
+        
+        Each object is written to "{name}.pack" as a record made of its
+        serialized length (4 bytes, big-endian) followed by the serialized
+        bytes. The records are followed by a JSON index mapping each key to
+        its record offset, and a fixed-size footer holding the index offset.
+        Keeping the index in the same file means the pack and its index are
+        replaced together atomically, and packing many small objects costs a
+        single file creation. Packed objects are read back with
+        get_from_pack() and are not included in count().
+        
+        When every value of an "npy" pack is an array of the same dtype and
+        shape, records hold only the raw array data and the layout is stored
+        once in the index instead of in a .npy header per record. Bytes-like
+        values are stored as-is, as with save().
+        
+        Args:
+            name: The pack name. An existing pack with this name is replaced.
+            items: (key, value) pairs to save. If a key appears more than once,
+                   the last value wins.
+            format: The format name (e.g., "json", "npy") of every value.
+        
+        Raises:
+            KeyError: If the format is not supported.
+        """
+        serializer = self._serializers.get(format)
+        if serializer is None:
+            raise KeyError(f"Unknown format: {format}")
+        pack_path = self._base_path / f"{name}{self.PACK_EXTENSION}"
+        
+        layout = None
+        encode = serializer.serialize
+        if isinstance(serializer, NumpySerializer):
+            items = list(items)
+            layout = serializer.shared_layout([value for _, value in items])
+            if layout is not None:
+                encode = serializer.serialize_raw
+        
+        def write(fd: int) -> None:
+            offsets: dict[str, int] = {}
+            offset = 0
+            for key, value in items:
+                data = value if isinstance(value, _BYTES_LIKE) else encode(value)
+                size = memoryview(data).nbytes
+                write_buffers(fd, [struct.pack(">I", size), data])
+                offsets[key] = offset
+                offset += 4 + size
+            
+            index: dict[str, Any] = {"format": format, "offsets": offsets}
+            if layout is not None:
+                index["layout"] = layout
+            index_data = self._serializers["json"].serialize(index)
+            write_buffers(fd, [index_data, self.PACK_FOOTER.pack(offset)])
+        
+        self._invalidate(pack_path)
+        self._write_atomic(pack_path, write)
+
+    def get_from_pack(self, name: str, key: str) -> Any:
+        """
+        Retrieve an object saved with save_pack().
+        
+        The pack file is memory-mapped and only the requested record is read.
+        The parsed index is kept in the LRU cache, keyed on the version of the
+        file that was mapped, so the index and the record always come from
+        the same pack even if it is replaced concurrently.
+        
+        Args:
+            name: The pack name.
+            key: The unique identifier of the object within the pack.
+        
+        Returns:
+            The deserialized object.
+        
+        Raises:
+            KeyError: If the pack or the key does not exist.
+        """
+        pack_path = self._base_path / f"{name}{self.PACK_EXTENSION}"
+        
+        try:
+            file = open(pack_path, "rb")
+        except FileNotFoundError:
+            raise KeyError(f"Pack not found: {name}") from None
+        
+        with file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            index = self._load_cached(
+                pack_path,
+                lambda _: self._read_pack_index(mapped),
+                stat=os.fstat(file.fileno()),
+            )
+            offset = index["offsets"].get(key)
+            if offset is None:
+                raise KeyError(f"Key not found: {key}")
+            (length,) = struct.unpack_from(">I", mapped, offset)
+            data = mapped[offset + 4:offset + 4 + length]
+        
+        serializer = self._serializers[index["format"]]
+        
+        layout = index.get("layout")
+        if layout is not None and isinstance(serializer, NumpySerializer):
+            return serializer.deserialize_raw(data, layout["dtype"], layout["shape"])
+        return serializer.deserialize(data)
+
+    def save_tar(self, name: str, items: Iterable[tuple[str, Any, str]]) -> None:
+        """
+        Save several objects into a single tar archive.
+        
+        The serialized objects are streamed into "{name}.tar" as members
+        named like the files save() would create. The directory then holds
+        one entry instead of one per object, which avoids most of the file
+        system metadata work for many small objects. Archived objects are read
+        back with get_from_tar() and are not included in count().
+        
+        Args:
+            name: The archive name. An existing archive with this name is
+                  replaced.
+            items: (key, value, format) tuples to save. Bytes-like values are
+                   stored as-is.
+        
+        Raises:
+            KeyError: If any format is not supported.
+        """
+        tar_path = self._base_path / f"{name}{self.TAR_EXTENSION}"
+        
+        def write(fd: int) -> None:
+            with open(fd, "wb", closefd=False) as file, tarfile.open(fileobj=file, mode="w|") as tar:
+                for key, value, format in items:
+                    serializer = self._serializers.get(format)
+                    if serializer is None:
+                        raise KeyError(f"Unknown format: {format}")
+                    if isinstance(value, _BYTES_LIKE):
+                        data = value
+                    else:
+                        data = serializer.serialize(value)
+                    member = tarfile.TarInfo(f"{key}{self._ext[format]}")
+                    member.size = memoryview(data).nbytes
+                    member.mtime = int(time.time())
+                    tar.addfile(member, BytesIO(data))
+        
+        self._invalidate(tar_path)
+        self._write_atomic(tar_path, write)
+
+    def get_from_tar(self, name: str, key: str, format: str) -> Any:
+        """
+        Retrieve an object saved with save_tar().
+        
+        The archive's member index is parsed once and kept in the LRU cache,
+        so later lookups seek straight to the member's data. The index is
+        keyed on the version of the archive that was opened and the member is
+        read from the same open file, so both always come from one archive
+        even if it is replaced concurrently.
+        
+        Args:
+            name: The archive name.
+            key: The unique identifier of the object within the archive.
+            format: The format name (e.g., "json", "npy").
+        
+        Returns:
+            The deserialized object.
+        
+        Raises:
+            KeyError: If the archive or the key does not exist, or the format
+                      is not supported.
+        """
+        serializer = self._serializers.get(format)
+        if serializer is None:
+            raise KeyError(f"Unknown format: {format}")
+        tar_path = self._base_path / f"{name}{self.TAR_EXTENSION}"
+        
+        try:
+            file = open(tar_path, "rb")
+        except FileNotFoundError:
+            raise KeyError(f"Archive not found: {name}") from None
+        
+        with file:
+            index = self._load_cached(
+                tar_path,
+                lambda _: self._read_tar_index(file),
+                stat=os.fstat(file.fileno()),
+            )
+            entry = index.get(f"{key}{self._ext[format]}")
+            if entry is None:
+                raise KeyError(f"Key not found: {key}")
+            offset, size = entry
+            file.seek(offset)
+            data = file.read(size)
+        return serializer.deserialize(data)
+
+    def _read_pack_index(self, mapped: mmap.mmap) -> dict[str, Any]:
+        """
+        Read the index stored at the end of a pack file.
+        
+        Args:
+            mapped: The memory-mapped pack file.
+        
+        Returns:
+            The parsed index: the pack's format, the record offset of each
+            key and, for raw NumPy records, their shared layout.
+        """
+        footer_start = len(mapped) - self.PACK_FOOTER.size
+        (index_start,) = self.PACK_FOOTER.unpack_from(mapped, footer_start)
+        return self._serializers["json"].deserialize(mapped[index_start:footer_start])
+
+    @staticmethod
+    def _read_tar_index(file: BinaryIO) -> dict[str, tuple[int, int]]:
+        """
+        Read the member index of a tar archive.
+        
+        Args:
+            file: The archive, open for reading in binary mode.
+        
+        Returns:
+            A mapping from member name to (data offset, size). If a name
+            appears more than once, the last member wins.
+        """
+        with tarfile.open(fileobj=file, mode="r:") as tar:
+            return {member.name: (member.offset_data, member.size) for member in tar if member.isfile()}
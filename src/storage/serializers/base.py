@@ -1,9 +1,41 @@
 """Abstract base class for serializers."""
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from pathlib import Path
 from typing import Any
 
 
+def write_buffers(fd: int, buffers: Sequence[Any]) -> None:
+    """
+    Write several buffers to a file descriptor, in order.
+    
+    Where available the buffers are submitted together with os.writev, so
+    they reach the kernel in one call without first being concatenated.
+    Partial writes are resumed until everything is written.
+    
+    Args:
+        fd: An open file descriptor.
+        buffers: Objects supporting the buffer protocol (bytes, bytearray,
+                 memoryview, contiguous NumPy arrays).
+    """
+    views = [view for view in (memoryview(b).cast("B") for b in buffers) if view]
+    if not hasattr(os, "writev"):
+        for view in views:
+            while view:
+                view = view[os.write(fd, view):]
+        return
+    
+    while views:
+        written = os.writev(fd, views)
+        while views and written >= len(views[0]):
+            written -= len(views.pop(0))
+        if written:
+            views[0] = views[0][written:]
+
+
 class Serializer(ABC):
     """
     Abstract base class for object serializers.
@@ -12,6 +44,8 @@ class Serializer(ABC):
     They are decoupled from storage - the storage layer handles persistence.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def format(self) -> str:
@@ -36,6 +70,53 @@ class Serializer(ABC):
         """
         pass
 
+    def serialize_batch(self, values: Sequence[Any], executor: Executor | None = None) -> list[bytes]:
+        """
+        Serialize several objects to bytes.
+        
+        The default implementation calls serialize() for each value.
+        Serializers that can process independent values in parallel should
+        override it, together with prefers_processes().
+        
+        Args:
+            values: The objects to serialize.
+            executor: A process pool to spread the work over, provided by
+                      callers that serialize several batches in a row when
+                      prefers_processes() asks for one. The default
+                      implementation ignores it.
+        
+        Returns:
+            The serialized bytes, in the same order as values.
+        """
+        return [self.serialize(value) for value in values]
+
+    def prefers_processes(self, count: int) -> bool:
+        """
+        Whether serializing count values is faster in a process pool.
+        
+        Args:
+            count: The number of values to serialize.
+        
+        Returns:
+            True if the time saved outweighs starting the pool and shipping
+            the values to it. The default implementation returns False.
+        """
+        return False
+
+    def serialize_to_fd(self, fd: int, value: Any) -> None:
+        """
+        Serialize an object directly into an open file.
+        
+        The default implementation writes the result of serialize().
+        Serializers whose output naturally comes in several pieces should
+        override it to write them without joining them first.
+        
+        Args:
+            fd: A file descriptor open for writing.
+            value: The object to serialize.
+        """
+        write_buffers(fd, [self.serialize(value)])
+
     @abstractmethod
     def deserialize(self, data: bytes) -> bytes:
         """
@@ -49,4 +130,20 @@ class Serializer(ABC):
         """
         pass
 
-
+    def deserialize_from_path(self, path: Path, mmap: bool = True) -> Any:
+        """
+        Deserialize an object directly from a file.
+        
+        The default implementation reads the whole file and calls
+        deserialize(). Serializers that can decode without materializing the
+        file contents (e.g. by memory-mapping it) should override it.
+        
+        Args:
+            path: The file holding the serialized bytes.
+            mmap: Whether the result may be backed by a read-only memory map
+                  of the file. The default implementation ignores it.
+        
+        Returns:
+            The deserialized object.
+        """
+        return self.deserialize(path.read_bytes())
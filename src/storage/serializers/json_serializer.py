@@ -1,12 +1,53 @@
 """JSON serializer for general Python objects."""
 
 import json
+import os
+import pickle
+import re
+import sys
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import asdict, is_dataclass
-from typing import Any
+from functools import singledispatch
+from operator import attrgetter
+from typing import Any, final
 
 from .base import Serializer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+# Datetimes are passed to the default hook so both encoders write str(value).
+# NumPy arrays and non-string keys are left to the pure Python fallback, as
+# orjson's own handling of them differs from it.
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+_ORJSON_INDENT = orjson.OPT_INDENT_2 if orjson is not None else 0
+
+# A run of digits that may be an integer wider than 64 bits, which orjson
+# decodes as a float
+_WIDE_INT = re.compile(rb"\d{19}")
+
+
+@singledispatch
+def _converters(value: Any) -> Any:
+    """
+    Convert a value with a converter registered via JsonSerializer.register.
+    
+    singledispatch resolves the converter from the value's type (honouring
+    subclasses) through its own per-type cache. This default implementation
+    marks types with no registered converter.
+    """
+    raise TypeError(f"No JSON converter registered for {type(value).__name__}")
+
+
+_NO_CONVERTER = _converters.dispatch(object)
+
+
+@final
 class JsonSerializer(Serializer):
     """
     Serializer for general Python objects using JSON format.
@@ -17,10 +58,55 @@ class JsonSerializer(Serializer):
     - Primitive types (str, int, float, bool, None)
     - Dataclasses
     - Objects with __dict__ attribute (converted to dict)
+    - Types with a converter added via JsonSerializer.register
     
-    Objects are converted to standard JSON format bytes.
+    Objects are converted to standard JSON format bytes. When the optional
+    orjson package is installed it is used for encoding and decoding, with the
+    pure Python conversion kept as a fallback for values orjson rejects
+    (e.g. integers wider than 64 bits or non-string keys) or would change
+    (NaN and infinities, which orjson writes as null), and both produce the
+    same JSON values. Documents that may contain such wide integers are
+    decoded with the standard library so they round-trip exactly.
+    
+    Output is indented for readability by default. Compact mode drops all
+    insignificant whitespace, which makes the output smaller and faster to
+    produce for data that is not meant to be read by people.
     """
 
+    __slots__ = ("_compact", "_orjson_options", "_encoders")
+
+    # Minimum batch size for which serialize_batch uses worker processes.
+    # Shipping a small object to a worker and its bytes back costs about as
+    # much as orjson takes to serialize it, so only the pure Python encoder
+    # (~35us per object) benefits; starting a pool costs ~10ms, which two
+    # workers only win back after about a thousand objects.
+    PARALLEL_THRESHOLD: int = 2048
+
+    def __init__(self, compact: bool = False) -> None:
+        """
+        Initialize the JSON serializer.
+        
+        Args:
+            compact: If True, write JSON without indentation or spaces after
+                     separators.
+        """
+        self._compact = compact
+        self._orjson_options = _ORJSON_OPTIONS if compact else _ORJSON_OPTIONS | _ORJSON_INDENT
+        
+        # Generated encoder for the attributes of the first instance seen of
+        # each plain class, with the attribute names it expects, or None for
+        # classes whose attributes attrgetter cannot read from the instance
+        self._encoders: dict[type, tuple[Callable[[Any], dict[str, Any]], frozenset[str]] | None] = {}
+
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        # Per-class caches may hold unpicklable local classes; workers rebuild them
+        return (type(self), (self._compact,))
+
+    @property
+    def compact(self) -> bool:
+        """Whether output is written without insignificant whitespace."""
+        return self._compact
+
     @property
     def format(self) -> str:
         return "json"
@@ -35,8 +121,66 @@ class JsonSerializer(Serializer):
         Returns:
             UTF-8 encoded JSON bytes.
         """
+        if orjson is not None:
+            try:
+                data = orjson.dumps(value, default=self._orjson_default, option=self._orjson_options)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                # orjson writes non-finite floats as null, indistinguishable
+                # from None, so any null is re-encoded with the standard
+                # library, which writes NaN and Infinity
+                if b"null" not in data:
+                    return data
+        
         json_data = self._to_json_compatible(value)
-        return json.dumps(json_data, indent=2, ensure_ascii=False).encode("utf-8")
+        if self._compact:
+            text = json.dumps(json_data, separators=(",", ":"), ensure_ascii=False)
+        else:
+            text = json.dumps(json_data, indent=2, ensure_ascii=False)
+        return text.encode("utf-8")
+
+    def serialize_batch(self, values: Sequence[Any], executor: Executor | None = None) -> list[bytes]:
+        """
+        Serialize several objects to JSON bytes.
+        
+        Without orjson serialization is pure Python and holds the GIL, so
+        large batches are spread across a process pool: the given executor,
+        or one created for this call. Small batches, single-core machines and
+        values that cannot be pickled to a worker are serialized in-process.
+        
+        Args:
+            values: The objects to serialize.
+            executor: A process pool to use instead of creating one.
+        
+        Returns:
+            UTF-8 encoded JSON bytes, in the same order as values.
+        """
+        if executor is None and not self.prefers_processes(len(values)):
+            return super().serialize_batch(values)
+        
+        cpu_count = os.cpu_count() or 1
+        chunksize = max(1, len(values) // (4 * cpu_count))
+        try:
+            if executor is not None:
+                return list(executor.map(self.serialize, values, chunksize=chunksize))
+            with ProcessPoolExecutor(max_workers=cpu_count) as executor:
+                return list(executor.map(self.serialize, values, chunksize=chunksize))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return super().serialize_batch(values)
+
+    def prefers_processes(self, count: int) -> bool:
+        """
+        Whether serializing count values is faster in a process pool.
+        
+        Args:
+            count: The number of values to serialize.
+        
+        Returns:
+            True for batches of at least PARALLEL_THRESHOLD values on a
+            multi-core machine without orjson.
+        """
+        return orjson is None and count >= self.PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1
 
     def deserialize(self, data: bytes) -> Any:
         """
@@ -48,38 +192,230 @@ class JsonSerializer(Serializer):
         Returns:
             The deserialized Python object (dict, list, or primitive).
         """
+        if orjson is not None and _WIDE_INT.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # e.g. NaN written by the standard library encoder
+                pass
         return json.loads(data.decode("utf-8"))
 
-    def _to_json_compatible(self, value: Any) -> Any:
+    @staticmethod
+    def register(cls: type, converter: Callable[[Any], Any]) -> None:
         """
-        Convert a Python object to a JSON-compatible structure.
+        Register a JSON converter for a type, shared by all JsonSerializers.
+        
+        The converter applies to instances of cls and its subclasses and
+        returns a JSON-compatible representation, which may itself contain
+        values that need converting. Types JSON supports directly (dict,
+        list, tuple, str, int, float, bool, None) cannot be overridden, and
+        when orjson is installed the types it encodes natively (such as
+        dataclasses and UUIDs) bypass converters.
+        
+        Args:
+            cls: The type to convert.
+            converter: Called with each instance of cls.
+        """
+        _converters.register(cls, converter)
+
+    @staticmethod
+    def _orjson_default(value: Any) -> Any:
+        """
+        Convert a value orjson cannot encode natively.
         
         Args:
             value: The object to convert.
         
         Returns:
-            A JSON-compatible representation of the object.
+            The result of the registered converter for the value's type, the
+            object's attribute dict, or its string form as a last resort.
         """
-        # Handle None and primitives
-        if value is None or isinstance(value, (str, int, float, bool)):
-            return value
+        converter = _converters.dispatch(type(value))
+        if converter is not _NO_CONVERTER:
+            return converter(value)
+        if hasattr(value, "__dict__"):
+            return value.__dict__
+        return str(value)
+
+    def _to_json_compatible(self, value: Any) -> Any:
+        """
+        Convert a Python object to a JSON-compatible structure.
+        
+        The object graph is walked iteratively with an explicit stack rather
+        than by recursion. Each container's output is allocated when the
+        container is reached, and its children are pushed as
+        (output, slot, child, depth) entries that fill the slots when popped.
         
-        # Handle dataclasses
-        if is_dataclass(value) and not isinstance(value, type):
-            return asdict(value)
+        Args:
+            value: The object to convert.
         
-        # Handle dictionaries
-        if isinstance(value, dict):
-            return {str(k): self._to_json_compatible(v) for k, v in value.items()}
+        Returns:
+            A JSON-compatible representation of the object.
         
-        # Handle lists and tuples
-        if isinstance(value, (list, tuple)):
-            return [self._to_json_compatible(item) for item in value]
+        Raises:
+            ValueError: If the object nests deeper than the recursion limit,
+                        which usually means it contains a reference cycle.
+        """
+        root: list[Any] = [None]
+        stack: deque[tuple[Any, Any, Any, int]] = deque([(root, 0, value, 0)])
+        max_depth = sys.getrecursionlimit()
+        encoders = self._encoders
+        dispatch = _converters.dispatch
         
-        # Handle objects with __dict__
-        if hasattr(value, "__dict__"):
-            return {k: self._to_json_compatible(v) for k, v in value.__dict__.items()}
+        while stack:
+            parent, slot, item, depth = stack.pop()
+            if depth > max_depth:
+                raise ValueError("Object nesting too deep (circular reference?)")
+            item_type = type(item)
+            
+            # Fast paths on the exact type: primitives and built-in containers
+            if item_type in _PRIMITIVE_TYPES:
+                parent[slot] = item
+                continue
+            handler = _CONTAINER_HANDLERS.get(item_type)
+            if handler is not None:
+                parent[slot] = handler(item, stack, depth + 1)
+                continue
+            
+            # Registered converters; their output is converted in turn
+            converter = dispatch(item_type)
+            if converter is not _NO_CONVERTER:
+                stack.append((parent, slot, converter(item), depth + 1))
+                continue
+            
+            # Instances of plain classes seen before
+            encoder = encoders.get(item_type)
+            if encoder is not None:
+                result = _push_encoded(item, *encoder, stack, depth + 1)
+                if result is not None:
+                    parent[slot] = result
+                    continue
+            
+            # Handle None and primitives
+            if item is None or isinstance(item, (str, int, float, bool)):
+                parent[slot] = item
+            
+            # Handle dataclasses
+            elif is_dataclass(item) and not isinstance(item, type):
+                parent[slot] = asdict(item)
+            
+            # Handle dictionaries
+            elif isinstance(item, dict):
+                parent[slot] = _push_dict(item, stack, depth + 1)
+            
+            # Handle lists and tuples
+            elif isinstance(item, (list, tuple)):
+                parent[slot] = _push_sequence(item, stack, depth + 1)
+            
+            # Handle objects with __dict__
+            elif hasattr(item, "__dict__"):
+                attributes = item.__dict__
+                if item_type not in encoders:
+                    fields = tuple(attributes)
+                    encoders[item_type] = (
+                        (_compile_encoder(fields), frozenset(fields))
+                        if _reads_instance_dict(item_type, fields)
+                        else None
+                    )
+                parent[slot] = _push_dict(attributes, stack, depth + 1)
+            
+            # Last resort: convert to string
+            else:
+                parent[slot] = str(item)
         
-        # Last resort: convert to string
-        return str(value)
+        return root[0]
+
+
+def _push_dict(value: dict, stack: deque, depth: int) -> dict[str, Any]:
+    """Allocate the output dict for value and push its items onto stack."""
+    result: dict[str, Any] = {}
+    entries = []
+    for k, v in value.items():
+        key = str(k)
+        result[key] = None
+        entries.append((result, key, v, depth))
+    # Pushed in reverse so items are filled in order and the last of any
+    # keys that collide after str() wins, as with a dict comprehension
+    stack.extend(reversed(entries))
+    return result
+
+
+def _push_sequence(value: list | tuple, stack: deque, depth: int) -> list[Any]:
+    """Allocate the output list for value and push its items onto stack."""
+    result: list[Any] = [None] * len(value)
+    stack.extend((result, i, item, depth) for i, item in enumerate(value))
+    return result
+
+
+def _compile_encoder(fields: tuple[str, ...]) -> Callable[[Any], dict[str, Any]]:
+    """
+    Generate a function that reads the given attributes of an instance with
+    one compiled attrgetter call and returns them in a dict literal.
+    
+    Callers must check that the instance __dict__ holds exactly these
+    attributes, since attrgetter also finds class attributes.
+    """
+    if not fields:
+        return lambda item: {}
+    names = [f"v{i}" for i in range(len(fields))]
+    items = ", ".join(f"{field!r}: {name}" for field, name in zip(fields, names))
+    # attrgetter returns a bare value rather than a tuple for one name
+    unpack = names[0] if len(fields) == 1 else ", ".join(names)
+    namespace: dict[str, Any] = {"get": attrgetter(*fields)}
+    exec(f"def encode(item):\n    {unpack} = get(item)\n    return {{{items}}}", namespace)
+    return namespace["encode"]
+
+
+def _reads_instance_dict(cls: type, fields: tuple[str, ...]) -> bool:
+    """
+    Check that attrgetter reads each of the given attributes of an instance
+    of cls from the instance __dict__.
+    
+    Dotted names are resolved by attrgetter as nested lookups, and data
+    descriptors on the class (e.g. properties) take precedence over the
+    instance __dict__.
+    """
+    for name in fields:
+        if "." in name:
+            return False
+        attribute = getattr(cls, name, None)
+        if hasattr(type(attribute), "__set__") or hasattr(type(attribute), "__delete__"):
+            return False
+    return True
+
+
+def _push_encoded(
+    item: Any,
+    encoder: Callable[[Any], dict[str, Any]],
+    fields: frozenset[str],
+    stack: deque,
+    depth: int,
+) -> dict[str, Any] | None:
+    """
+    Build the output dict for an instance with the encoder generated for its
+    class, and push the values that still need converting onto stack.
+    
+    Returns None, pushing nothing, if the instance's attribute names differ
+    from the ones the encoder was generated for. This is checked against the
+    instance __dict__, as attrgetter would fall back to class attributes.
+    """
+    if item.__dict__.keys() != fields:
+        return None
+    result = encoder(item)
+    stack.extend(
+        (result, name, item, depth)
+        for name, item in result.items()
+        if type(item) not in _PRIMITIVE_TYPES
+    )
+    return result
+
+
+# Exact types passed through unchanged
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
 
+# Exact-type dispatch for the common containers, checked before isinstance()
+_CONTAINER_HANDLERS = {
+    dict: _push_dict,
+    list: _push_sequence,
+    tuple: _push_sequence,
+}
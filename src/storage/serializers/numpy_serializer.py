@@ -1,13 +1,44 @@
 """NumPy array serializer."""
 
+import pickle
+import threading
+from collections.abc import Sequence
 from io import BytesIO
-from typing import Any
+from pathlib import Path
+from typing import Any, final
 
 import numpy as np
 
-from .base import Serializer
+from .base import Serializer, write_buffers
 
 
+# Maximum number of idle buffers kept per thread
+_MAX_POOLED_BUFFERS = 16
+
+_buffer_pool = threading.local()
+
+
+def _acquire_buffer() -> BytesIO:
+    """Take an empty BytesIO from the current thread's pool, or create one."""
+    pool: list[BytesIO] | None = getattr(_buffer_pool, "buffers", None)
+    if not pool:
+        return BytesIO()
+    buffer = pool.pop()
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
+def _release_buffer(buffer: BytesIO) -> None:
+    """Return a BytesIO to the current thread's pool for reuse."""
+    pool: list[BytesIO] | None = getattr(_buffer_pool, "buffers", None)
+    if pool is None:
+        pool = _buffer_pool.buffers = []
+    if len(pool) < _MAX_POOLED_BUFFERS:
+        pool.append(buffer)
+
+
+@final
 class NumpySerializer(Serializer):
     """
     Serializer for NumPy arrays using the native .npy format.
@@ -16,23 +47,59 @@ class NumpySerializer(Serializer):
     .npy format, which preserves the array's dtype, shape, and data exactly.
     """
 
+    __slots__ = ()
+
     @property
     def format(self) -> str:
         return "npy"
 
-    def serialize(self, value: Any) -> bytes:
+    def serialize(self, value: Any) -> bytearray:
         """
         Serialize a NumPy array to bytes in .npy format.
         
+        The .npy header and the raw array data are copied once into a buffer
+        preallocated to the exact output size, instead of growing a BytesIO
+        and copying it out again.
+        
         Args:
             value: The NumPy array to serialize.
         
         Returns:
             The .npy formatted bytes.
         """
-        buffer = BytesIO()
-        np.save(buffer, value)
-        return buffer.getvalue()
+        array = np.asanyarray(value)
+        header = self._header(array)
+        if header is None:
+            buffer = _acquire_buffer()
+            try:
+                np.save(buffer, array)
+                return bytearray(buffer.getbuffer())
+            finally:
+                _release_buffer(buffer)
+        
+        body = self._body(array)
+        data = bytearray(len(header) + body.nbytes)
+        data[:len(header)] = header
+        memoryview(data)[len(header):] = body
+        return data
+
+    def serialize_to_fd(self, fd: int, value: Any) -> None:
+        """
+        Write a NumPy array to an open file in .npy format.
+        
+        The header and the array's own memory are written with a single
+        vectored write, so the array data is never copied in user space.
+        
+        Args:
+            fd: A file descriptor open for writing.
+            value: The NumPy array to serialize.
+        """
+        array = np.asanyarray(value)
+        header = self._header(array)
+        if header is None:
+            write_buffers(fd, [self.serialize(array)])
+            return
+        write_buffers(fd, [header, self._body(array)])
 
     def deserialize(self, data: bytes) -> np.ndarray:
         """
@@ -44,7 +111,163 @@ class NumpySerializer(Serializer):
         Returns:
             The deserialized NumPy array.
         """
+        # Not pooled: BytesIO shares the bytes object it wraps, so this
+        # costs no copy, whereas refilling a pooled buffer would copy data
         buffer = BytesIO(data)
         return np.load(buffer)
 
+    def serialize_raw(self, value: Any) -> bytes:
+        """
+        Serialize a NumPy array to its raw data bytes, without a .npy header.
+        
+        The dtype and shape are not recorded, so the caller must store them
+        separately (see shared_layout) to read the data back.
+        
+        Args:
+            value: The NumPy array to serialize.
+        
+        Returns:
+            The array data in C order.
+        """
+        return np.asarray(value).tobytes(order="C")
 
+    def deserialize_raw(self, data: bytes, dtype: str, shape: Sequence[int]) -> np.ndarray:
+        """
+        Rebuild a NumPy array from bytes written by serialize_raw.
+        
+        Args:
+            data: The raw array data.
+            dtype: The dtype string of the array (e.g. "<f8").
+            shape: The shape of the array.
+        
+        Returns:
+            A read-only array viewing data without copying it.
+        """
+        return np.frombuffer(data, dtype=np.dtype(dtype)).reshape(shape)
+
+    def shared_layout(self, values: Sequence[Any]) -> dict[str, Any] | None:
+        """
+        Get the dtype and shape shared by a batch of arrays.
+        
+        Batches with a shared layout can be stored with serialize_raw and a
+        single copy of the layout instead of one .npy header per array.
+        
+        Args:
+            values: The arrays to inspect.
+        
+        Returns:
+            {"dtype": dtype string, "shape": list of ints} if every value is a
+            NumPy array of the same plain (non-structured, non-object) dtype
+            and shape, otherwise None.
+        """
+        if not values or not all(isinstance(value, np.ndarray) for value in values):
+            return None
+        dtype = values[0].dtype
+        shape = values[0].shape
+        if dtype.hasobject or dtype.names is not None or dtype.subdtype is not None:
+            return None
+        if any(value.dtype != dtype or value.shape != shape for value in values):
+            return None
+        return {"dtype": dtype.str, "shape": list(shape)}
+
+    def serialize_out_of_band(self, value: Any) -> tuple[bytes, list[pickle.PickleBuffer]]:
+        """
+        Pickle a NumPy array with its data passed out-of-band.
+        
+        Uses pickle protocol 5, so the returned payload only describes the
+        array while the data stays in buffers backed by the array's own
+        memory. No copy of the data is made.
+        
+        Args:
+            value: The NumPy array to serialize.
+        
+        Returns:
+            The pickle payload and the out-of-band data buffers.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        return payload, buffers
+
+    def deserialize_out_of_band(self, payload: bytes, buffers: Sequence[Any]) -> np.ndarray:
+        """
+        Rebuild a NumPy array from serialize_out_of_band output.
+        
+        This unpickles the payload, so it must only be used on trusted data.
+        
+        Args:
+            payload: The pickle payload.
+            buffers: The out-of-band data buffers, in the order they were
+                     produced.
+        
+        Returns:
+            The deserialized NumPy array, sharing memory with buffers where
+            possible.
+        """
+        return pickle.loads(payload, buffers=buffers)
+
+    def deserialize_from_path(self, path: Path, mmap: bool = True) -> np.ndarray:
+        """
+        Load a NumPy array directly from a .npy file.
+        
+        Args:
+            path: The .npy file to load.
+            mmap: If True, return a read-only memory-mapped array instead of
+                  reading the data into memory.
+        
+        Returns:
+            The loaded NumPy array.
+        """
+        return np.load(path, mmap_mode="r" if mmap else None)
+
+    @staticmethod
+    def _header(array: np.ndarray) -> bytes | None:
+        """
+        Build the .npy header for an array, as np.save would write it.
+        
+        Args:
+            array: The array to describe.
+        
+        Returns:
+            The magic string, version and padded header dict, or None if the
+            array must be written by np.save itself: object arrays, which are
+            pickled, and headers needing format version 3.0 (e.g. non-Latin-1
+            field names).
+        """
+        if array.dtype.hasobject:
+            return None
+        header_data = np.lib.format.header_data_from_array_1_0(array)
+        buffer = _acquire_buffer()
+        try:
+            for write_header in (np.lib.format.write_array_header_1_0, np.lib.format.write_array_header_2_0):
+                buffer.seek(0)
+                buffer.truncate()
+                try:
+                    write_header(buffer, header_data)
+                except (ValueError, UnicodeEncodeError):
+                    # Header too large or not Latin-1 encodable for this version
+                    continue
+                return buffer.getvalue()
+            return None
+        finally:
+            _release_buffer(buffer)
+
+    @staticmethod
+    def _body(array: np.ndarray) -> np.ndarray:
+        """
+        Get the array data in the order the .npy header declares, as bytes.
+        
+        Args:
+            array: The array to write.
+        
+        Returns:
+            A flat uint8 view of the data (a copy only if the array is neither
+            C- nor Fortran-contiguous).
+        """
+        if array.flags.c_contiguous:
+            contiguous = array
+        elif array.flags.f_contiguous:
+            # Fortran-ordered arrays are written as their C-ordered transpose
+            contiguous = array.T
+        else:
+            contiguous = np.ascontiguousarray(array)
+        return np.asarray(contiguous).reshape(-1).view(np.uint8)
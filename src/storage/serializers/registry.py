@@ -1,13 +1,18 @@
 """Registry for mapping formats to serializers."""
 
+from typing import final
+
 from .base import Serializer
 
 
+@final
 class SerializerRegistry:
     """
     Registry that maps formats to serializers.
     """
 
+    __slots__ = ("_format_map",)
+
     def __init__(self) -> None:
         self._format_map: dict[str, Serializer] = {}
 
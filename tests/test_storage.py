@@ -0,0 +1,478 @@
+import asyncio
+import json
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from storage import AsyncLocalFileStorage, JsonSerializer, LocalFileStorage, NumpySerializer
+
+
+class SomeClass:
+    def __init__(self, text: str, number: float):
+        self.txt = text
+        self.number = number
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalFileStorage(tmp_path)
+
+
+def test_save_and_get_json(storage):
+    storage.save("a", SomeClass("A", 1), "json")
+    assert storage.get("a", "json") == {"txt": "A", "number": 1}
+
+
+def test_save_and_get_npy(storage):
+    arr = np.arange(6).reshape(2, 3)
+    storage.save("m", arr, "npy")
+    np.testing.assert_array_equal(storage.get("m", "npy"), arr)
+
+
+def test_save_many(storage):
+    storage.save_many((str(i), SomeClass(chr(65 + i), i), "json") for i in range(5))
+    assert storage.count() == 5
+    assert storage.get("2", "json") == {"txt": "C", "number": 2}
+
+
+def test_save_many_unknown_format_writes_nothing(storage):
+    with pytest.raises(KeyError):
+        storage.save_many([("a", {"x": 1}, "json"), ("b", 1, "xml")])
+    assert storage.count() == 0
+
+
+def test_save_many_last_duplicate_wins(storage):
+    storage.save_many([("a", {"x": 1}, "json"), ("a", {"x": 2}, "json")])
+    assert storage.get("a", "json") == {"x": 2}
+
+
+def test_json_serialize_batch_matches_serialize():
+    from concurrent.futures import ProcessPoolExecutor
+
+    serializer = JsonSerializer()
+    values = [SomeClass(str(i), i) for i in range(4)]
+    expected = [serializer.serialize(v) for v in values]
+    assert serializer.serialize_batch(values) == expected
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert serializer.serialize_batch(values, executor) == expected
+
+
+def test_save_many_with_writer_threads(storage, monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    monkeypatch.setattr(LocalFileStorage, "PARALLEL_WRITE_THRESHOLD", 2)
+    monkeypatch.setattr(LocalFileStorage, "MAX_INFLIGHT_BYTES", 64)
+    storage.save_many((str(i), SomeClass(chr(65 + i), i), "json") for i in range(20))
+    assert storage.count() == 20
+    assert storage.get("19", "json") == {"txt": "T", "number": 19}
+
+
+def test_save_many_with_process_pool(storage, monkeypatch):
+    monkeypatch.setattr(JsonSerializer, "prefers_processes", lambda self, count: True)
+    storage.save_many((str(i), SomeClass(chr(65 + i), i), "json") for i in range(5))
+    assert storage.get("4", "json") == {"txt": "E", "number": 4}
+
+
+def test_json_serializer_round_trip():
+    serializer = JsonSerializer()
+    value = {"obj": SomeClass("é", 1.5), 1: (1, 2), "none": None}
+    assert serializer.deserialize(serializer.serialize(value)) == {
+        "obj": {"txt": "é", "number": 1.5},
+        "1": [1, 2],
+        "none": None,
+    }
+
+
+def test_json_serializer_wide_int():
+    assert json.loads(JsonSerializer().serialize({"big": 2**70 + 1})) == {"big": 2**70 + 1}
+
+
+def test_json_fallback_conversion_matches_structure():
+    serializer = JsonSerializer()
+    value = {"a": [SomeClass("x", 1), (1, 2, {"b": None})], 1: "one", "1": "uno"}
+    assert serializer._to_json_compatible(value) == {
+        "a": [{"txt": "x", "number": 1}, [1, 2, {"b": None}]],
+        "1": "uno",
+    }
+
+
+def test_json_fallback_conversion_rejects_cycles():
+    value: list = []
+    value.append(value)
+    with pytest.raises(ValueError):
+        JsonSerializer()._to_json_compatible(value)
+
+
+def test_numpy_serializer_reuses_buffers():
+    serializer = NumpySerializer()
+    first = np.arange(1000, dtype=np.float64)
+    second = np.array([1, 2, 3], dtype=np.int8)
+    assert serializer.serialize(first) != serializer.serialize(second)
+    np.testing.assert_array_equal(serializer.deserialize(serializer.serialize(second)), second)
+    np.testing.assert_array_equal(serializer.deserialize(serializer.serialize(first)), first)
+
+
+@pytest.mark.filterwarnings("ignore:Stored array in format 3.0")
+@pytest.mark.parametrize("arr", [
+    np.arange(12, dtype=np.float32).reshape(3, 4),
+    np.asfortranarray(np.arange(6).reshape(2, 3)),
+    np.arange(10)[::2],
+    np.zeros((0, 3)),
+    np.array(5),
+    np.zeros(2, dtype=[("a", "<i4"), ("b", "<f8")]),
+    np.zeros(2, dtype=[("α", "<i4")]),
+])
+def test_numpy_serialize_matches_np_save(arr):
+    expected = BytesIO()
+    np.save(expected, arr)
+    assert bytes(NumpySerializer().serialize(arr)) == expected.getvalue()
+
+
+def test_get_npy_is_memory_mapped(storage):
+    storage.save("m", np.arange(4), "npy")
+    loaded = storage.get("m", "npy")
+    assert isinstance(loaded, np.memmap)
+    assert not loaded.flags.writeable
+    copy = storage.get("m", "npy", mmap=False)
+    assert not isinstance(copy, np.memmap)
+    copy[0] = 10
+    np.testing.assert_array_equal(storage.get("m", "npy"), np.arange(4))
+
+
+def test_get_returns_cached_object_until_file_changes(storage):
+    storage.save("a", {"x": 1}, "json")
+    first = storage.get("a", "json")
+    assert storage.get("a", "json") is first
+    storage.save("a", {"x": 2}, "json")
+    assert storage.get("a", "json") == {"x": 2}
+
+
+def test_get_notices_same_size_rewrite_by_another_instance(tmp_path):
+    reader = LocalFileStorage(tmp_path)
+    writer = LocalFileStorage(tmp_path)
+    for _ in range(20):
+        writer.save("a", {"v": "x"}, "json")
+        assert reader.get("a", "json") == {"v": "x"}
+        writer.save("a", {"v": "y"}, "json")
+        assert reader.get("a", "json") == {"v": "y"}
+
+
+def test_get_cache_disabled(tmp_path):
+    storage = LocalFileStorage(tmp_path, cache_size=0)
+    storage.save("a", {"x": 1}, "json")
+    assert storage.get("a", "json") is not storage.get("a", "json")
+
+
+def test_get_after_delete_raises(storage):
+    storage.save("a", {"x": 1}, "json")
+    storage.get("a", "json")
+    storage.delete("a", "json")
+    with pytest.raises(KeyError):
+        storage.get("a", "json")
+
+
+def test_count_tracks_changes(storage):
+    assert storage.count() == 0
+    storage.save("a", {"x": 1}, "json")
+    storage.save("a", {"x": 2}, "json")
+    storage.save("m", np.arange(3), "npy")
+    assert storage.count() == 2
+    storage.delete("a", "json")
+    assert storage.count() == 1
+    (storage.base_path / "external.json").write_text("{}")
+    assert storage.count() == 2
+
+
+def test_count_with_concurrent_saves(storage):
+    from concurrent.futures import ThreadPoolExecutor
+
+    assert storage.count() == 0
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(storage.save, str(i % 50), i, "json") for i in range(200)]
+        futures += [pool.submit(storage.count) for _ in range(20)]
+        for future in futures:
+            future.result()
+    assert storage.count() == 50
+    assert storage.count() == len(list(storage.base_path.iterdir()))
+
+
+def test_count_with_another_writer(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    first = LocalFileStorage(tmp_path)
+    second = LocalFileStorage(tmp_path)
+    for i in range(20):
+        assert first.count() == 2 * i
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(first.save, f"a{i}", i, "json"), pool.submit(second.save, f"b{i}", i, "json")]
+            for future in futures:
+                future.result()
+        assert first.count() == second.count() == 2 * i + 2
+
+
+def test_count_with_concurrent_saves_of_one_key(storage):
+    from concurrent.futures import ThreadPoolExecutor
+
+    for i in range(10):
+        assert storage.count() == i
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(storage.save, f"k{i}", n, "json") for n in range(8)]:
+                future.result()
+        assert storage.count() == i + 1
+
+
+def test_path_cache_is_bounded(storage, monkeypatch):
+    monkeypatch.setattr(LocalFileStorage, "PATH_CACHE_SIZE", 3)
+    for i in range(10):
+        storage.save(str(i), i, "json")
+    assert len(storage._path_cache) <= 3
+    assert storage.get("9", "json") == 9
+    with pytest.raises(KeyError):
+        storage.exists("9", "xml")
+
+
+def test_save_leaves_no_temporary_files(storage):
+    storage.save("a", {"x": 1}, "json")
+    storage.save("m", np.asfortranarray(np.arange(6).reshape(2, 3)), "npy")
+    storage.save_many([("b", [1], "json"), ("c", [2], "json")])
+    assert sorted(p.name for p in storage.base_path.iterdir()) == ["a.json", "b.json", "c.json", "m.npy"]
+    np.testing.assert_array_equal(storage.get("m", "npy"), np.arange(6).reshape(2, 3))
+
+
+def test_failed_save_keeps_previous_value(storage):
+    storage.save("a", {"x": 1}, "json")
+
+    class Broken:
+        @property
+        def __dict__(self):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        storage.save("a", Broken(), "json")
+    assert storage.get("a", "json") == {"x": 1}
+    assert [p.name for p in storage.base_path.iterdir()] == ["a.json"]
+
+
+def test_save_pack_and_get_from_pack(storage):
+    storage.save_pack("objs", ((str(i), SomeClass(chr(65 + i), i)) for i in range(5)), "json")
+    storage.save_pack("arrays", [("a", np.arange(3)), ("b", np.eye(2))], "npy")
+    assert storage.get_from_pack("objs", "3") == {"txt": "D", "number": 3}
+    np.testing.assert_array_equal(storage.get_from_pack("arrays", "b"), np.eye(2))
+    assert storage.count() == 0
+    assert sorted(p.name for p in storage.base_path.iterdir()) == ["arrays.pack", "objs.pack"]
+    storage.save_pack("objs", [("9", [9])], "json")
+    assert storage.get_from_pack("objs", "9") == [9]
+    with pytest.raises(KeyError):
+        storage.get_from_pack("objs", "3")
+    with pytest.raises(KeyError):
+        storage.get_from_pack("objs", "8")
+    with pytest.raises(KeyError):
+        storage.get_from_pack("missing", "0")
+
+
+def test_get_from_pack_after_rewrite(storage):
+    for _ in range(20):
+        storage.save_pack("p", [("a", {"v": "1"}), ("b", {"v": "2"})], "json")
+        assert storage.get_from_pack("p", "a") == {"v": "1"}
+        storage.save_pack("p", [("b", {"v": "2"}), ("a", {"v": "1"})], "json")
+        assert storage.get_from_pack("p", "a") == {"v": "1"}
+
+
+def test_async_storage(tmp_path):
+    async def scenario():
+        storage = AsyncLocalFileStorage(tmp_path)
+        await storage.save_many((str(i), SomeClass(chr(65 + i), i), "json") for i in range(40))
+        await storage.save("m", np.arange(3), "npy")
+        assert await storage.count() == 41
+        assert await storage.get("7", "json") == {"txt": "H", "number": 7}
+        assert await storage.exists("m", "npy")
+        assert await storage.delete("m", "npy")
+        with pytest.raises(KeyError):
+            await storage.save_many([("x", 1, "xml")])
+
+    asyncio.run(scenario())
+
+
+def test_save_bytes_and_get_raw(storage):
+    payload = b'{"x": 1}'
+    storage.save("a", payload, "json")
+    assert storage.get("a", "json") == {"x": 1}
+    assert bytes(storage.get("a", "json", raw=True)) == payload
+    storage.save("empty", b"", "json")
+    assert bytes(storage.get("empty", "json", raw=True)) == b""
+    with pytest.raises(KeyError):
+        storage.get("missing", "json", raw=True)
+
+
+def test_json_fallback_conversion_handles_differing_instances():
+    serializer = JsonSerializer()
+    first = SomeClass("x", 1)
+    second = SomeClass("y", 2)
+    second.extra = True
+    third = SomeClass("z", 3)
+    del third.number
+    third.other = None
+    assert serializer._to_json_compatible([first, second, third, first]) == [
+        {"txt": "x", "number": 1},
+        {"txt": "y", "number": 2, "extra": True},
+        {"txt": "z", "other": None},
+        {"txt": "x", "number": 1},
+    ]
+
+
+def test_bytes_are_stored_as_is_by_every_save(storage):
+    payload = b'{"x": 1}'
+    storage.save_many([("a", payload, "json"), ("b", {"y": 2}, "json"), ("c", memoryview(payload), "json")])
+    assert bytes(storage.get("a", "json", raw=True)) == payload
+    assert bytes(storage.get("c", "json", raw=True)) == payload
+    assert storage.get("b", "json") == {"y": 2}
+    storage.save_pack("p", [("a", payload), ("b", {"y": 2})], "json")
+    assert storage.get_from_pack("p", "a") == {"x": 1}
+    assert storage.get_from_pack("p", "b") == {"y": 2}
+
+
+def test_json_serializer_compact():
+    value = {"a": [1, 2], "b": SomeClass("x", 1)}
+    assert JsonSerializer(compact=True).serialize(value) == b'{"a":[1,2],"b":{"txt":"x","number":1}}'
+    assert JsonSerializer(compact=True).serialize({"big": 2**70}) == b'{"big":1180591620717411303424}'
+    assert b"\n" in JsonSerializer().serialize(value)
+
+
+def test_json_fallback_conversion_single_attribute_class():
+    class Single:
+        def __init__(self, value):
+            self.value = value
+
+    serializer = JsonSerializer()
+    assert serializer._to_json_compatible([Single(1), Single([2])]) == [{"value": 1}, {"value": [2]}]
+
+
+def test_numpy_pack_with_shared_layout_stores_raw_records(storage):
+    arrays = {str(i): np.full((2, 3), i, dtype=np.float32) for i in range(4)}
+    storage.save_pack("same", arrays.items(), "npy")
+    storage.save_pack("mixed", [("a", np.arange(3)), ("b", np.eye(2))], "npy")
+    with open(storage.base_path / "same.pack", "rb") as file:
+        data = file.read()
+    records_size = 4 * (4 + arrays["0"].nbytes)
+    assert int.from_bytes(data[-8:], "big") == records_size
+    assert json.loads(data[records_size:-8])["layout"] == {"dtype": "<f4", "shape": [2, 3]}
+    np.testing.assert_array_equal(storage.get_from_pack("same", "2"), arrays["2"])
+    np.testing.assert_array_equal(storage.get_from_pack("mixed", "b"), np.eye(2))
+
+
+def test_numpy_out_of_band_round_trip():
+    serializer = NumpySerializer()
+    arr = np.arange(1000, dtype=np.int64).reshape(10, 100)
+    payload, buffers = serializer.serialize_out_of_band(arr)
+    assert len(payload) < arr.nbytes
+    np.testing.assert_array_equal(serializer.deserialize_out_of_band(payload, buffers), arr)
+
+
+def test_json_serializer_registered_converter():
+    class Point:
+        __slots__ = ("x", "y")
+
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    JsonSerializer.register(Point, lambda p: [p.x, p.y])
+    serializer = JsonSerializer()
+    value = {"points": [Point(1, 2), Point(3, (4, 5))]}
+    expected = {"points": [[1, 2], [3, [4, 5]]]}
+    assert serializer._to_json_compatible(value) == expected
+    assert serializer.deserialize(serializer.serialize(value)) == expected
+
+
+def test_save_tar_and_get_from_tar(storage):
+    items = [(str(i), SomeClass(chr(65 + i), i), "json") for i in range(5)]
+    items.append(("m", np.arange(4), "npy"))
+    storage.save_tar("bundle", items)
+    assert [p.name for p in storage.base_path.iterdir()] == ["bundle.tar"]
+    assert storage.get_from_tar("bundle", "4", "json") == {"txt": "E", "number": 4}
+    np.testing.assert_array_equal(storage.get_from_tar("bundle", "m", "npy"), np.arange(4))
+    with pytest.raises(KeyError):
+        storage.get_from_tar("bundle", "m", "json")
+    with pytest.raises(KeyError):
+        storage.save_tar("bad", [("a", 1, "xml")])
+    assert not (storage.base_path / "bad.tar").exists()
+
+
+def test_get_from_tar_after_rewrite(tmp_path):
+    reader = LocalFileStorage(tmp_path)
+    writer = LocalFileStorage(tmp_path)
+    for _ in range(20):
+        writer.save_tar("t", [("a", {"v": "1"}, "json"), ("b", {"v": "22"}, "json")])
+        assert reader.get_from_tar("t", "a", "json") == {"v": "1"}
+        writer.save_tar("t", [("b", {"v": "22"}, "json"), ("a", {"v": "1"}, "json")])
+        assert reader.get_from_tar("t", "a", "json") == {"v": "1"}
+
+
+def test_json_fallback_conversion_unusual_attribute_names():
+    obj = SomeClass("x", 1)
+    setattr(obj, "with space", [1])
+    setattr(obj, "quote'\"", {"a": SomeClass("y", 2)})
+    serializer = JsonSerializer()
+    expected = {
+        "txt": "x",
+        "number": 1,
+        "with space": [1],
+        "quote'\"": {"a": {"txt": "y", "number": 2}},
+    }
+    assert serializer._to_json_compatible([obj, obj]) == [expected, expected]
+
+    class Dotted:
+        pass
+
+    dotted = Dotted()
+    setattr(dotted, "a.b", 1)
+    assert serializer._to_json_compatible([dotted, dotted]) == [{"a.b": 1}, {"a.b": 1}]
+
+
+def test_json_orjson_and_fallback_agree(monkeypatch):
+    import datetime
+
+    from storage.serializers import json_serializer
+
+    values = [
+        {"big": 2**70 + 1, "small": [1, 2.5]},
+        {None: 1, True: 2, 1.5: 3},
+        np.arange(3),
+        np.asfortranarray(np.eye(2)),
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        {"nan": float("nan"), "inf": [float("inf"), -float("inf")], "none": None},
+    ]
+    serializer = JsonSerializer()
+    fast = [serializer.serialize(v) for v in values]
+    monkeypatch.setattr(json_serializer, "orjson", None)
+    slow = [serializer.serialize(v) for v in values]
+    assert fast == slow
+    monkeypatch.undo()
+    assert serializer.deserialize(fast[0]) == {"big": 2**70 + 1, "small": [1, 2.5]}
+    restored = serializer.deserialize(fast[-1])
+    assert np.isnan(restored["nan"]) and restored["inf"] == [float("inf"), -float("inf")]
+    assert serializer.deserialize(slow[1]) == {"None": 1, "True": 2, "1.5": 3}
+
+
+def test_json_fallback_conversion_ignores_class_attributes(storage, monkeypatch):
+    from storage.serializers import json_serializer
+
+    class WithDefault:
+        b = "class-default"
+
+        def __init__(self, **attributes):
+            self.__dict__.update(attributes)
+
+    class WithProperty:
+        def __init__(self, value):
+            self.__dict__["value"] = value
+
+        @property
+        def value(self):
+            return "property"
+
+    serializer = JsonSerializer()
+    values = [WithDefault(a=1, b=2), WithDefault(a=3, c=4), WithProperty(5), WithProperty(6)]
+    assert serializer._to_json_compatible(values) == [{"a": 1, "b": 2}, {"a": 3, "c": 4}, {"value": 5}, {"value": 6}]
+    monkeypatch.setattr(json_serializer, "orjson", None)
+    storage.save_many([("x", WithDefault(a=1, b=2), "json"), ("y", WithDefault(a=3, c=4), "json")])
+    assert storage.get("y", "json") == {"a": 3, "c": 4}